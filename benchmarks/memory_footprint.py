@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""Compare the per-result memory footprint of the old and new result records.
+
+Run from the repository root:
+
+    python benchmarks/memory_footprint.py [count]
+"""
+import os
+import sys
+import tracemalloc
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List
+
+# Add parent directory to path so we can import the project modules
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+os.chdir(ROOT_DIR)
+
+from models import (
+    LLMResponse,
+    create_token_usage,
+    create_validation_result,
+)
+
+DEFAULT_COUNT = 5000
+
+
+def _fake_sdk_response(index: int, text: str) -> Any:
+    """Build an object shaped like an OpenAI-style chat completion."""
+    return SimpleNamespace(
+        id=f"chatcmpl-{index:024d}",
+        object="chat.completion",
+        created=1712400000 + index,
+        model="gpt-4o-mini-2024-07-18",
+        system_fingerprint=f"fp_{index:010x}",
+        choices=[
+            SimpleNamespace(
+                index=0,
+                finish_reason="stop",
+                logprobs=None,
+                message=SimpleNamespace(role="assistant", content=text, refusal=None),
+            )
+        ],
+        usage=SimpleNamespace(
+            prompt_tokens=850,
+            completion_tokens=420,
+            total_tokens=1270,
+            prompt_tokens_details=SimpleNamespace(cached_tokens=0, audio_tokens=0),
+            completion_tokens_details=SimpleNamespace(
+                reasoning_tokens=0, audio_tokens=0
+            ),
+        ),
+        headers={
+            "content-type": "application/json",
+            "x-request-id": f"req_{index:032x}",
+            "openai-processing-ms": str(900 + index % 100),
+            "x-ratelimit-remaining-tokens": str(150000 - index),
+            "x-ratelimit-reset-tokens": "6ms",
+        },
+    )
+
+
+def _legacy_record(index: int, text: str) -> Dict[str, Any]:
+    """Build a result the way it was kept before: a plain dict."""
+    return {
+        "question": "What is the capital of Sweden?",
+        "model_name": "gpt-4o-mini",
+        "answer": text,
+        "cost": 0.0,
+        "timestamp": datetime.now(),
+    }
+
+
+def _compact_record(index: int, text: str) -> Any:
+    """Build a result the way it is kept now: a NamedTuple."""
+    return create_validation_result(
+        question="What is the capital of Sweden?",
+        model_name="gpt-4o-mini",
+        answer=text,
+    )
+
+
+def _debug_record(index: int, text: str) -> Any:
+    """Build a result together with the response kept by keep_raw_responses."""
+    raw = _fake_sdk_response(index, text)
+    usage = create_token_usage(raw.usage.prompt_tokens, raw.usage.completion_tokens)
+    response = LLMResponse(text=text, usage=usage, raw_response=raw)
+    return (response, _compact_record(index, text))
+
+
+def measure_bytes_per_record(build: Callable[[int, str], Any], count: int) -> float:
+    """Measure the retained bytes per record for the given builder."""
+    texts = [f"Stockholm is the capital of Sweden. ({i})" for i in range(count)]
+
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+    records: List[Any] = [build(i, texts[i]) for i in range(count)]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    del records
+    return (current - baseline) / count
+
+
+def main() -> None:
+    """Print the per-result footprint before and after."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_COUNT
+
+    before = measure_bytes_per_record(_legacy_record, count)
+    after = measure_bytes_per_record(_compact_record, count)
+    debug = measure_bytes_per_record(_debug_record, count)
+
+    print(f"Records measured:               {count}")
+    print(f"Before (dict):                  {before:8.0f} bytes/result")
+    print(f"After (NamedTuple):             {after:8.0f} bytes/result")
+    print(f"Reduction:                      {(1 - after / before) * 100:7.1f}%")
+    print(f"With keep_raw_responses=true:   {debug:8.0f} bytes/result")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import Future, wait
+from datetime import datetime
+from typing import Any, Dict, Optional, Set, Tuple
+
+from models import ValidationResult, create_validation_result
+
+DEFAULT_FSYNC_INTERVAL = 1.0
+
+
+def get_journal_path(questions_file: str, mode: str) -> str:
+    """Get the checkpoint journal path for a batch of questions in a mode.
+
+    The path includes a hash of the questions file's absolute path, so files
+    with the same name in different directories get separate journals.
+    """
+    absolute_path = os.path.abspath(questions_file)
+    digest = hashlib.sha1(absolute_path.encode("utf-8")).hexdigest()[:8]
+    stem = os.path.splitext(os.path.basename(questions_file))[0]
+    return os.path.join("outputs", f"{stem}-{mode}-{digest}.journal.jsonl")
+
+
+def _result_to_entry(
+    question: str, stage: int, result: ValidationResult
+) -> Dict[str, Any]:
+    """Convert a completed stage into a journal entry."""
+    return {
+        "type": "stage",
+        "question": question,
+        "stage": stage,
+        "model_name": result.model_name,
+        "answer": result.answer,
+        "cost": result.cost,
+        "timestamp": result.timestamp.isoformat(),
+    }
+
+
+def _entry_to_result(entry: Dict[str, Any]) -> ValidationResult:
+    """Convert a journal entry back into a validation result."""
+    return create_validation_result(
+        question=entry["question"],
+        model_name=entry["model_name"],
+        answer=entry["answer"],
+        cost=entry["cost"],
+        timestamp=datetime.fromisoformat(entry["timestamp"]),
+    )
+
+
+class CheckpointJournal:
+    """Append-only journal of completed pipeline stages.
+
+    Every entry is flushed to the OS as soon as it is written, so it survives a
+    crash or Ctrl-C. Calls to fsync are batched to at most one per interval.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        resume: bool = False,
+        fsync_interval: float = DEFAULT_FSYNC_INTERVAL,
+    ) -> None:
+        self.path = path
+        self.fsync_interval = fsync_interval
+        self._lock = threading.Lock()
+        self._stages: Dict[Tuple[str, int], ValidationResult] = {}
+        self._completed: Set[str] = set()
+        self._pending: Set[Future] = set()
+
+        if resume and os.path.exists(path):
+            self._replay()
+
+        self._file = open(path, "a" if resume else "w")
+        self._last_fsync = time.time()
+
+    def _replay(self) -> None:
+        """Load completed stages and questions from an existing journal."""
+        complete_length = 0
+        with open(self.path, "rb") as f:
+            for line in f:
+                if not line.endswith(b"\n"):
+                    # A partially written last line from an interrupted run
+                    break
+                complete_length += len(line)
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                self._apply(entry)
+
+        # Drop the partial line so new entries don't get appended onto it
+        os.truncate(self.path, complete_length)
+
+    def _apply(self, entry: Dict[str, Any]) -> None:
+        """Apply a journal entry to the in-memory state."""
+        if entry["type"] == "stage":
+            key = (entry["question"], entry["stage"])
+            self._stages[key] = _entry_to_result(entry)
+        elif entry["type"] == "complete":
+            self._completed.add(entry["question"])
+
+    def _write(self, entry: Dict[str, Any]) -> None:
+        """Append an entry, syncing to disk if the interval has passed."""
+        with self._lock:
+            self._apply(entry)
+            if self._file.closed:
+                return
+            self._file.write(json.dumps(entry) + "\n")
+            self._file.flush()
+            if time.time() - self._last_fsync >= self.fsync_interval:
+                os.fsync(self._file.fileno())
+                self._last_fsync = time.time()
+
+    def get_stage(self, question: str, stage: int) -> Optional[ValidationResult]:
+        """Get the result of a completed stage, if there is one."""
+        with self._lock:
+            return self._stages.get((question, stage))
+
+    def is_complete(self, question: str) -> bool:
+        """Check whether every stage of a question has been completed and saved."""
+        with self._lock:
+            return question in self._completed
+
+    def record_stage(
+        self, question: str, stage: int, result: ValidationResult
+    ) -> None:
+        """Record a completed stage."""
+        self._write(_result_to_entry(question, stage, result))
+
+    def mark_complete(self, question: str) -> None:
+        """Record that a question has been fully answered and saved."""
+        self._write({"type": "complete", "question": question})
+
+    def track(self, future: Future) -> None:
+        """Wait for a still-running stage to be recorded before closing."""
+        with self._lock:
+            self._pending.add(future)
+
+    def close(self) -> None:
+        """Wait for tracked stages, sync remaining entries and close the journal."""
+        wait(set(self._pending))
+        with self._lock:
+            if self._file.closed:
+                return
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._file.close()
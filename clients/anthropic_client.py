@@ -1,6 +1,11 @@
-from typing import Any, Dict
+from typing import Any
 from clients.client_types import PromptType
-from models import create_llm_response
+from models import (
+    LLMResponse,
+    TokenUsage,
+    create_llm_response,
+    create_token_usage,
+)
 from config import get_system_prompt, get_pricing
 
 
@@ -9,7 +14,7 @@ def ask_question_claude(
     model_name: str,
     question: str,
     prompt_type: PromptType = PromptType.DEFAULT,
-) -> Dict[str, Any]:
+) -> LLMResponse:
     """Ask a question to the Claude LLM."""
     system_prompt = get_system_prompt(
         "default" if prompt_type == PromptType.DEFAULT else "validation"
@@ -22,12 +27,22 @@ def ask_question_claude(
             {"role": "user", "content": question},
         ],
     )
-    return create_llm_response(text=response.content[0].text, raw_response=response)
+    usage = create_token_usage(
+        response.usage.input_tokens, response.usage.output_tokens
+    )
+    return create_llm_response(
+        text=response.content[0].text, usage=usage, raw_response=response
+    )
 
 
-def calculate_costs_claude(model_name: str, response: Any) -> float:
+def calculate_costs_claude(model_name: str, usage: TokenUsage) -> float:
     """Calculate the cost of a Claude response."""
     pricing = get_pricing(model_name)
-    input_cost = response.usage.input_tokens * pricing["input_price"]
-    output_cost = response.usage.output_tokens * pricing["output_price"]
+    input_cost = usage.input_tokens * pricing["input_price"]
+    output_cost = usage.output_tokens * pricing["output_price"]
     return input_cost + output_cost
+
+
+def warm_up_claude(client: Any) -> None:
+    """Open a pooled connection to the Claude API with a lightweight request."""
+    client.models.list(limit=1)
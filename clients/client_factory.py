@@ -9,10 +9,26 @@ from mistralai import Mistral
 from google import genai
 
 # Import client functions
-from clients.anthropic_client import ask_question_claude, calculate_costs_claude
-from clients.openai_client import ask_question_openai, calculate_costs_openai
-from clients.mistral_client import ask_question_mistral, calculate_costs_mistral
-from clients.gemini_client import ask_question_gemini, calculate_costs_gemini
+from clients.anthropic_client import (
+    ask_question_claude,
+    calculate_costs_claude,
+    warm_up_claude,
+)
+from clients.openai_client import (
+    ask_question_openai,
+    calculate_costs_openai,
+    warm_up_openai,
+)
+from clients.mistral_client import (
+    ask_question_mistral,
+    calculate_costs_mistral,
+    warm_up_mistral,
+)
+from clients.gemini_client import (
+    ask_question_gemini,
+    calculate_costs_gemini,
+    warm_up_gemini,
+)
 
 
 def create_client(provider: str, model_name: str) -> ClientFunctions:
@@ -22,18 +38,22 @@ def create_client(provider: str, model_name: str) -> ClientFunctions:
         client = anthropic.Anthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
         ask_fn = partial(ask_question_claude, client, model_name)
         cost_fn = partial(calculate_costs_claude, model_name)
+        warm_up_fn = partial(warm_up_claude, client)
     elif provider == "openai":
         client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
         ask_fn = partial(ask_question_openai, client, model_name)
         cost_fn = partial(calculate_costs_openai, model_name)
+        warm_up_fn = partial(warm_up_openai, client)
     elif provider == "mistral":
         client = Mistral(api_key=os.getenv("MISTRAL_API_KEY"))
         ask_fn = partial(ask_question_mistral, client, model_name)
         cost_fn = partial(calculate_costs_mistral, model_name)
+        warm_up_fn = partial(warm_up_mistral, client)
     elif provider == "gemini":
         client = genai.Client(api_key=os.getenv("GEMINI_API_KEY"))
         ask_fn = partial(ask_question_gemini, client, model_name)
         cost_fn = partial(calculate_costs_gemini, model_name)
+        warm_up_fn = partial(warm_up_gemini, client)
     else:
         raise ValueError(f"Unknown provider: {provider}")
     
@@ -41,5 +61,6 @@ def create_client(provider: str, model_name: str) -> ClientFunctions:
     return {
         "ask_question": ask_fn,
         "calculate_costs": cost_fn,
+        "warm_up": warm_up_fn,
         "model_name": model_name,
     }
\ No newline at end of file
@@ -11,4 +11,5 @@ class PromptType(Enum):
 class ClientFunctions(TypedDict):
     ask_question: Callable
     calculate_costs: Callable
+    warm_up: Callable
     model_name: str
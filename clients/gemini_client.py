@@ -1,6 +1,11 @@
-from typing import Any, Dict
+from typing import Any
 from clients.client_types import PromptType
-from models import create_llm_response
+from models import (
+    LLMResponse,
+    TokenUsage,
+    create_llm_response,
+    create_token_usage,
+)
 from config import get_system_prompt, get_pricing
 from google.genai import types
 
@@ -10,7 +15,7 @@ def ask_question_gemini(
     model_name: str,
     question: str,
     prompt_type: PromptType = PromptType.DEFAULT,
-) -> Dict[str, Any]:
+) -> LLMResponse:
     """Ask a question to the Gemini LLM."""
     system_prompt = get_system_prompt(
         "default" if prompt_type == PromptType.DEFAULT else "validation"
@@ -20,14 +25,21 @@ def ask_question_gemini(
         contents=question,
         config=types.GenerateContentConfig(system_instruction=system_prompt),
     )
-    return create_llm_response(text=response.text, raw_response=response)
+    usage = create_token_usage(
+        response.usage_metadata.prompt_token_count,
+        response.usage_metadata.candidates_token_count,
+    )
+    return create_llm_response(text=response.text, usage=usage, raw_response=response)
 
 
-def calculate_costs_gemini(model_name: str, response: Any) -> float:
+def calculate_costs_gemini(model_name: str, usage: TokenUsage) -> float:
     """Calculate the cost of a Gemini response."""
     pricing = get_pricing(model_name)
-    input_cost = response.usage_metadata.prompt_token_count * pricing["input_price"]
-    output_cost = (
-        response.usage_metadata.candidates_token_count * pricing["output_price"]
-    )
+    input_cost = usage.input_tokens * pricing["input_price"]
+    output_cost = usage.output_tokens * pricing["output_price"]
     return input_cost + output_cost
+
+
+def warm_up_gemini(client: Any) -> None:
+    """Open a pooled connection to the Gemini API with a lightweight request."""
+    client.models.list(config={"page_size": 1})
@@ -1,6 +1,11 @@
-from typing import Any, Dict
+from typing import Any
 from clients.client_types import PromptType
-from models import create_llm_response
+from models import (
+    LLMResponse,
+    TokenUsage,
+    create_llm_response,
+    create_token_usage,
+)
 from config import get_system_prompt, get_pricing
 
 
@@ -9,7 +14,7 @@ def ask_question_mistral(
     model_name: str,
     question: str,
     prompt_type: PromptType = PromptType.DEFAULT,
-) -> Dict[str, Any]:
+) -> LLMResponse:
     """Ask a question to the Mistral LLM."""
     system_prompt = get_system_prompt(
         "default" if prompt_type == PromptType.DEFAULT else "validation"
@@ -21,18 +26,25 @@ def ask_question_mistral(
             {"role": "user", "content": question},
         ],
     )
+    usage = create_token_usage(
+        completion.usage.prompt_tokens, completion.usage.completion_tokens
+    )
     return create_llm_response(
         text=completion.choices[0].message.content,
+        usage=usage,
         raw_response=completion,
     )
 
 
-def calculate_costs_mistral(model_name: str, response: Any) -> float:
+def calculate_costs_mistral(model_name: str, usage: TokenUsage) -> float:
     """Calculate the cost of a Mistral response."""
     pricing = get_pricing(model_name)
-    input_tokens = response.usage.prompt_tokens
-    output_tokens = response.usage.completion_tokens
     return (
-        pricing["input_price"] * input_tokens
-        + pricing["output_price"] * output_tokens
+        pricing["input_price"] * usage.input_tokens
+        + pricing["output_price"] * usage.output_tokens
     )
+
+
+def warm_up_mistral(client: Any) -> None:
+    """Open a pooled connection to the Mistral API with a lightweight request."""
+    client.models.list()
@@ -1,6 +1,11 @@
-from typing import Any, Dict
+from typing import Any
 from clients.client_types import PromptType
-from models import create_llm_response
+from models import (
+    LLMResponse,
+    TokenUsage,
+    create_llm_response,
+    create_token_usage,
+)
 from config import get_system_prompt, get_pricing
 
 
@@ -9,7 +14,7 @@ def ask_question_openai(
     model_name: str,
     question: str,
     prompt_type: PromptType = PromptType.DEFAULT,
-) -> Dict[str, Any]:
+) -> LLMResponse:
     """Ask a question to the OpenAI LLM."""
     system_prompt = get_system_prompt(
         "default" if prompt_type == PromptType.DEFAULT else "validation"
@@ -21,14 +26,24 @@ def ask_question_openai(
             {"role": "user", "content": question},
         ],
     )
+    usage = create_token_usage(
+        completion.usage.prompt_tokens, completion.usage.completion_tokens
+    )
     return create_llm_response(
-        text=completion.choices[0].message.content, raw_response=completion
+        text=completion.choices[0].message.content,
+        usage=usage,
+        raw_response=completion,
     )
 
 
-def calculate_costs_openai(model_name: str, response: Any) -> float:
+def calculate_costs_openai(model_name: str, usage: TokenUsage) -> float:
     """Calculate the cost of an OpenAI response."""
     pricing = get_pricing(model_name)
-    input_cost = response.usage.prompt_tokens * pricing["input_price"]
-    output_cost = response.usage.completion_tokens * pricing["output_price"]
+    input_cost = usage.input_tokens * pricing["input_price"]
+    output_cost = usage.output_tokens * pricing["output_price"]
     return input_cost + output_cost
+
+
+def warm_up_openai(client: Any) -> None:
+    """Open a pooled connection to the OpenAI API with a lightweight request."""
+    client.models.list()
@@ -1,6 +1,6 @@
 import json
 import os
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from functools import lru_cache
 
 
@@ -19,6 +19,11 @@ def get_pricing(model_name: str) -> Dict[str, float]:
     return config["models"][model_name]
 
 
+def should_keep_raw_responses() -> bool:
+    """Check whether full SDK response objects should be kept for debugging."""
+    return load_config().get("debug", {}).get("keep_raw_responses", False)
+
+
 def get_performance_mode_config(mode: str) -> Dict[str, Dict[str, str]]:
     """Get the configuration for a specific performance mode."""
     config = load_config()
@@ -27,8 +32,40 @@ def get_performance_mode_config(mode: str) -> Dict[str, Dict[str, str]]:
     return config["performance_modes"][mode]
 
 
+def get_quorum_config(mode: str) -> Optional[Dict[str, Any]]:
+    """Get the fact-checking quorum for a performance mode, if one is set."""
+    config = load_config()
+    return config.get("quorum", {}).get(mode)
+
+
+def get_packing_config() -> Dict[str, Any]:
+    """Get the fact-check packing configuration."""
+    config = load_config()
+    return config.get("packing", {})
+
+
+def get_checkpoint_config() -> Dict[str, Any]:
+    """Get the checkpoint journal configuration."""
+    config = load_config()
+    return config.get("checkpoint", {})
+
+
+PROMPT_TEMPLATE_FILES = {
+    "validation": "validation_prompt.md",
+    "summarize": "summarize_prompt.md",
+    "packed_validation": "packed_validation_prompt.md",
+    "fact_check_process": "fact_check_process.md",
+}
+
+SYSTEM_PROMPT_FILES = {
+    "default": "default_system_prompt.md",
+    "validation": "validation_system_prompt.md",
+}
+
+
+@lru_cache(maxsize=None)
 def read_prompt_file(filename: str) -> str:
-    """Read a prompt from a markdown file."""
+    """Read a prompt from a markdown file (cached for efficiency)."""
     filepath = os.path.join("prompts", filename)
     with open(filepath, "r") as f:
         return f.read().strip()
@@ -36,27 +73,24 @@ def read_prompt_file(filename: str) -> str:
 
 def get_prompt_template(prompt_type: str) -> str:
     """Get a prompt template by type."""
-    prompt_file_map = {
-        "validation": "validation_prompt.md",
-        "summarize": "summarize_prompt.md",
-    }
-
-    if prompt_type not in prompt_file_map:
+    if prompt_type not in PROMPT_TEMPLATE_FILES:
         raise ValueError(f"Prompt template {prompt_type} not found")
 
-    file = prompt_file_map[prompt_type]
+    file = PROMPT_TEMPLATE_FILES[prompt_type]
     return read_prompt_file(file)
 
 
 def get_system_prompt(prompt_type: str) -> str:
     """Get a system prompt by type."""
     prompt_type = prompt_type.lower()
-    system_prompt_file_map = {
-        "default": "default_system_prompt.md",
-        "validation": "validation_system_prompt.md",
-    }
 
-    if prompt_type not in system_prompt_file_map:
+    if prompt_type not in SYSTEM_PROMPT_FILES:
         raise ValueError(f"System prompt {prompt_type} not found")
 
-    return read_prompt_file(system_prompt_file_map[prompt_type])
+    return read_prompt_file(SYSTEM_PROMPT_FILES[prompt_type])
+
+
+def preload_prompts() -> None:
+    """Load all prompt files into the cache ahead of the first question."""
+    for filename in (*PROMPT_TEMPLATE_FILES.values(), *SYSTEM_PROMPT_FILES.values()):
+        read_prompt_file(filename)
@@ -1,20 +1,30 @@
-import sys
+import argparse
 import time
-from typing import Dict, List, Any
+from typing import List, Any, Optional
 
 from dotenv import load_dotenv
 
+from checkpoint import CheckpointJournal, DEFAULT_FSYNC_INTERVAL, get_journal_path
 from clients.client_factory import create_client
-from model_selector import get_model_configs, get_performance_mode
+from config import get_checkpoint_config, get_packing_config, preload_prompts
+from models import QuorumConfig, ValidationResult, create_packing_config
+from model_selector import (
+    get_fact_check_quorum,
+    get_model_configs,
+    get_performance_mode,
+)
 from utils import (
     convert_to_sek,
     print_markdown,
     get_question,
+    read_questions_file,
+    ensure_output_directory,
     console,
     COLORS,
     print_summary_table,
 )
-from validator import validate_with_models
+from session import ConnectionWarmer, display_prewarm_report, is_exit_command
+from validator import validate_batch_with_models, validate_with_models
 
 load_dotenv()
 
@@ -22,19 +32,48 @@ load_dotenv()
 def main() -> None:
     """Cross-validate an answer across multiple LLMs and print markdown output."""
     try:
-        mode_arg = _parse_command_args()
-        _run_validation_process(mode_arg)
+        args = _parse_command_args()
+        if args.batch:
+            _run_batch(args.mode, args.batch, args.resume, args.pack)
+        elif args.interactive:
+            _run_interactive_session(args.mode)
+        else:
+            _run_validation_process(args.mode)
     except Exception as e:
         console.print(f"[{COLORS['error']}]Error:[/] {str(e)}")
         raise SystemExit(1)
 
 
-def _parse_command_args() -> str:
-    """Parse command-line arguments for mode."""
-    mode = "fast"
-    if len(sys.argv) > 1:
-        mode = sys.argv[1]
-    return mode
+def _parse_command_args() -> argparse.Namespace:
+    """Parse command-line arguments for mode and session options."""
+    parser = argparse.ArgumentParser(
+        description="Cross-validate answers across multiple LLMs."
+    )
+    parser.add_argument(
+        "mode", nargs="?", default="fast", help="Performance mode (fast/c/max)"
+    )
+    parser.add_argument(
+        "-i", "--interactive", action="store_true", help="Ask several questions"
+    )
+    parser.add_argument(
+        "--batch", metavar="FILE", help="Answer every question in FILE, one per line"
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Skip stages and questions already in the batch's checkpoint journal",
+    )
+    parser.add_argument(
+        "--pack",
+        action="store_true",
+        help="Fact-check several batch questions per request",
+    )
+    args = parser.parse_args()
+    if args.resume and not args.batch:
+        parser.error("--resume requires --batch")
+    if args.pack and not args.batch:
+        parser.error("--pack requires --batch")
+    return args
 
 
 def _get_clients_from_mode(mode: str) -> List[Any]:
@@ -53,16 +92,16 @@ def _display_performance_mode(mode: str) -> None:
     console.print()
 
 
-def _print_model_answer(result: Dict[str, Any]) -> None:
+def _print_model_answer(result: ValidationResult) -> None:
     """Print the model name and its answer with markdown formatting."""
     console.print(
-        f"[{COLORS['info']}]Final answer from:[/] [bold]{result['model_name']}[/]"
+        f"[{COLORS['info']}]Final answer from:[/] [bold]{result.model_name}[/]"
     )
     console.print()
-    print_markdown(result["answer"])
+    print_markdown(result.answer)
 
 
-def _display_final_answer(results: List[Dict[str, Any]]) -> None:
+def _display_final_answer(results: List[ValidationResult]) -> None:
     """Display the final answer with proper styling and formatting."""
     final_result = results[-1]
     console.rule("[bold cyan]Cross-Validation Result[/]", style="cyan")
@@ -70,9 +109,9 @@ def _display_final_answer(results: List[Dict[str, Any]]) -> None:
     _print_model_answer(final_result)
 
 
-def _calculate_total_cost(results: List[Dict[str, Any]]) -> float:
+def _calculate_total_cost(results: List[ValidationResult]) -> float:
     """Calculate the total cost in USD from micropennies."""
-    total = sum(result["cost"] for result in results)
+    total = sum(result.cost for result in results)
     return total / 1000000
 
 
@@ -82,6 +121,32 @@ def _display_cost_in_sek(usd_cost: float) -> None:
     console.print(f"[{COLORS['muted']}]Total cost in SEK: {sek_amount:.3f} SEK[/]")
 
 
+def _answer_question(
+    clients: List[Any],
+    question: str,
+    quorum: Optional[QuorumConfig],
+    start_time: float,
+    journal: Optional[CheckpointJournal] = None,
+) -> None:
+    """Validate a question and display the final answer and summary."""
+    results = validate_with_models(
+        clients=clients, question=question, quorum=quorum, journal=journal
+    )
+    _display_results(results, start_time)
+
+
+def _display_results(results: List[ValidationResult], start_time: float) -> None:
+    """Display the final answer and the cost and timing summary."""
+    if not results:
+        return
+
+    _display_final_answer(results)
+
+    total_cost = _calculate_total_cost(results)
+    elapsed_time = time.time() - start_time
+    print_summary_table(results, elapsed_time, total_cost)
+
+
 def _run_validation_process(mode_arg: str) -> None:
     """Run the complete validation process with timing and results display."""
     mode = get_performance_mode(mode_arg)
@@ -91,13 +156,116 @@ def _run_validation_process(mode_arg: str) -> None:
     _display_performance_mode(mode)
 
     clients = _get_clients_from_mode(mode)
-    results = validate_with_models(clients=clients, question=question)
+    quorum = get_fact_check_quorum(mode)
+    _answer_question(clients, question, quorum, start_time)
 
-    _display_final_answer(results)
 
-    total_cost = _calculate_total_cost(results)
-    elapsed_time = time.time() - start_time
-    print_summary_table(results, elapsed_time, total_cost)
+def _read_interactive_question() -> Optional[str]:
+    """Read the next question, returning None when input is closed."""
+    try:
+        return get_question()
+    except (EOFError, KeyboardInterrupt):
+        console.print()
+        return None
+
+
+def _run_interactive_session(mode_arg: str) -> None:
+    """Answer questions in a loop, keeping clients warm between them."""
+    mode = get_performance_mode(mode_arg)
+    _display_performance_mode(mode)
+
+    clients = _get_clients_from_mode(mode)
+    quorum = get_fact_check_quorum(mode)
+    preload_prompts()
+    warmer = ConnectionWarmer(clients)
+    warm_clients = warmer.wrap_clients()
+
+    while True:
+        warmer.start()
+        question = _read_interactive_question()
+        if is_exit_command(question):
+            warmer.stop()
+            break
+        if not question:
+            continue
+
+        start_time = time.time()
+        _answer_question(warm_clients, question, quorum, start_time)
+        display_prewarm_report(clients, warmer.stop())
+
+
+def _open_journal(
+    questions_file: str, mode: str, resume: bool
+) -> CheckpointJournal:
+    """Open the checkpoint journal for a batch of questions in a mode."""
+    ensure_output_directory()
+    fsync_interval = get_checkpoint_config().get(
+        "fsync_interval_seconds", DEFAULT_FSYNC_INTERVAL
+    )
+    return CheckpointJournal(
+        get_journal_path(questions_file, mode),
+        resume=resume,
+        fsync_interval=fsync_interval,
+    )
+
+
+def _get_pending_questions(
+    questions: List[str], journal: CheckpointJournal
+) -> List[str]:
+    """Get the unique questions that the journal has not completed yet."""
+    pending = []
+    for number, question in enumerate(questions, start=1):
+        if journal.is_complete(question) or question in pending:
+            reason = "duplicate" if question in pending else "already completed"
+            console.print(
+                f"[{COLORS['muted']}]Skipping question {number}/{len(questions)}"
+                f" ({reason})[/]"
+            )
+            continue
+        pending.append(question)
+    return pending
+
+
+def _answer_questions_packed(
+    clients: List[Any],
+    questions: List[str],
+    quorum: Optional[QuorumConfig],
+    journal: CheckpointJournal,
+) -> None:
+    """Answer questions in groups, packing each group's fact-checks together."""
+    packing = create_packing_config(**get_packing_config())
+    group_size = packing["max_questions"]
+
+    for start in range(0, len(questions), group_size):
+        group = questions[start : start + group_size]
+        start_time = time.time()
+        for results in validate_batch_with_models(
+            clients, group, packing, quorum=quorum, journal=journal
+        ):
+            _display_results(results, start_time)
+
+
+def _run_batch(
+    mode_arg: str, questions_file: str, resume: bool, pack: bool
+) -> None:
+    """Answer every question in a file, checkpointing each completed stage."""
+    mode = get_performance_mode(mode_arg)
+    _display_performance_mode(mode)
+
+    questions = read_questions_file(questions_file)
+    clients = _get_clients_from_mode(mode)
+    quorum = get_fact_check_quorum(mode)
+    journal = _open_journal(questions_file, mode, resume)
+
+    try:
+        pending = _get_pending_questions(questions, journal)
+        if pack:
+            _answer_questions_packed(clients, pending, quorum, journal)
+        else:
+            for question in pending:
+                _answer_question(clients, question, quorum, time.time(), journal)
+    finally:
+        journal.close()
 
 
 if __name__ == "__main__":
@@ -1,5 +1,6 @@
-from typing import Dict
-from config import get_performance_mode_config
+from typing import Dict, Optional
+from config import get_performance_mode_config, get_quorum_config
+from models import QuorumConfig, create_quorum_config
 
 
 def get_performance_mode(mode_arg: str) -> str:
@@ -19,4 +20,12 @@ def get_performance_mode(mode_arg: str) -> str:
 
 def get_model_configs(mode: str) -> Dict[str, Dict[str, str]]:
     """Get model configurations for the given performance mode."""
-    return get_performance_mode_config(mode)
\ No newline at end of file
+    return get_performance_mode_config(mode)
+
+
+def get_fact_check_quorum(mode: str) -> Optional[QuorumConfig]:
+    """Get the fact-checking quorum for the given performance mode."""
+    quorum = get_quorum_config(mode)
+    if quorum is None:
+        return None
+    return create_quorum_config(**quorum)
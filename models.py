@@ -1,5 +1,7 @@
 from datetime import datetime
-from typing import Any, Dict, Optional, TypedDict
+from typing import Any, Dict, List, NamedTuple, Optional, TypedDict
+
+from config import should_keep_raw_responses
 
 
 class ModelConfig(TypedDict):
@@ -7,7 +9,23 @@ class ModelConfig(TypedDict):
     model_name: str
 
 
-class ValidationResult(TypedDict):
+class QuorumConfig(TypedDict):
+    size: int
+    require_agreement: bool
+    append_late_results: bool
+
+
+class PackingConfig(TypedDict):
+    token_budget: int
+    max_questions: int
+
+
+class TokenUsage(NamedTuple):
+    input_tokens: int
+    output_tokens: int
+
+
+class ValidationResult(NamedTuple):
     question: str
     model_name: str
     answer: str
@@ -15,9 +33,10 @@ class ValidationResult(TypedDict):
     timestamp: datetime
 
 
-class LLMResponse(TypedDict):
+class LLMResponse(NamedTuple):
     text: str
-    raw_response: Any
+    usage: TokenUsage
+    raw_response: Optional[Any] = None
 
 
 def create_model_config(client_type: str, model_name: str) -> ModelConfig:
@@ -25,6 +44,24 @@ def create_model_config(client_type: str, model_name: str) -> ModelConfig:
     return {"client_type": client_type, "model_name": model_name}
 
 
+def create_quorum_config(
+    size: int, require_agreement: bool = False, append_late_results: bool = False
+) -> QuorumConfig:
+    """Create an immutable fact-checking quorum configuration."""
+    return {
+        "size": size,
+        "require_agreement": require_agreement,
+        "append_late_results": append_late_results,
+    }
+
+
+def create_packing_config(
+    token_budget: int = 6000, max_questions: int = 5
+) -> PackingConfig:
+    """Create an immutable fact-check packing configuration."""
+    return {"token_budget": token_budget, "max_questions": max_questions}
+
+
 def create_validation_result(
     question: str,
     model_name: str,
@@ -33,15 +70,58 @@ def create_validation_result(
     timestamp: Optional[datetime] = None,
 ) -> ValidationResult:
     """Create an immutable validation result."""
-    return {
-        "question": question,
-        "model_name": model_name,
-        "answer": answer,
-        "cost": cost,
-        "timestamp": timestamp or datetime.now(),
-    }
+    return ValidationResult(
+        question=question,
+        model_name=model_name,
+        answer=answer,
+        cost=cost,
+        timestamp=timestamp or datetime.now(),
+    )
+
+
+def create_token_usage(
+    input_tokens: Optional[int], output_tokens: Optional[int]
+) -> TokenUsage:
+    """Create an immutable token usage record."""
+    return TokenUsage(
+        input_tokens=input_tokens or 0, output_tokens=output_tokens or 0
+    )
+
+
+def add_token_usage(first: TokenUsage, second: TokenUsage) -> TokenUsage:
+    """Add two token usage records together."""
+    return create_token_usage(
+        first.input_tokens + second.input_tokens,
+        first.output_tokens + second.output_tokens,
+    )
+
+
+def _split_tokens(tokens: int, weights: List[float]) -> List[int]:
+    """Split a token count by weight, giving any rounding remainder to the last."""
+    if not any(weights):
+        weights = [1.0] * len(weights)
+    total_weight = sum(weights)
+    shares = [int(tokens * weight / total_weight) for weight in weights]
+    shares[-1] += tokens - sum(shares)
+    return shares
+
+
+def split_token_usage(
+    usage: TokenUsage, input_weights: List[float], output_weights: List[float]
+) -> List[TokenUsage]:
+    """Split a shared response's token usage proportionally between its items."""
+    input_shares = _split_tokens(usage.input_tokens, input_weights)
+    output_shares = _split_tokens(usage.output_tokens, output_weights)
+    return [
+        create_token_usage(input_tokens, output_tokens)
+        for input_tokens, output_tokens in zip(input_shares, output_shares)
+    ]
 
 
-def create_llm_response(text: str, raw_response: Any) -> LLMResponse:
-    """Create an immutable LLM response."""
-    return {"text": text, "raw_response": raw_response}
\ No newline at end of file
+def create_llm_response(
+    text: str, usage: TokenUsage, raw_response: Any = None
+) -> LLMResponse:
+    """Create an immutable LLM response, dropping the SDK object unless debugging."""
+    if not should_keep_raw_responses():
+        raw_response = None
+    return LLMResponse(text=text, usage=usage, raw_response=raw_response)
@@ -0,0 +1,167 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Dict, List, Optional, Set
+
+from utils import console, COLORS
+
+EXIT_COMMANDS = ("exit", "quit", "q")
+
+# The OpenAI and Anthropic SDKs close pooled connections after 5 idle seconds
+KEEPALIVE_EXPIRY = 5.0
+REWARM_INTERVAL = 4.0
+MAX_WARM_DURATION = 300.0
+
+
+class ConnectionWarmer:
+    """Keep provider connections warm until each client is first used.
+
+    The first warm-up of each client opens a new connection, later ones reuse
+    it. The difference between the two is the setup time a warm connection
+    saves, and it is only counted if the connection is still warm when the
+    client's stage starts.
+    """
+
+    def __init__(
+        self,
+        clients: List[Dict[str, Any]],
+        interval: float = REWARM_INTERVAL,
+        max_duration: float = MAX_WARM_DURATION,
+    ) -> None:
+        self.clients = clients
+        self.interval = interval
+        self.max_duration = max_duration
+        self._lock = threading.Lock()
+        self._client_locks = {
+            client["model_name"]: threading.Lock() for client in clients
+        }
+        self._cold_latency: Dict[str, float] = {}
+        self._warm_latency: Dict[str, float] = {}
+        self._last_warmed: Dict[str, float] = {}
+        self._released: Set[str] = set()
+        self._savings: Dict[str, float] = {}
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def wrap_clients(self) -> List[Dict[str, Any]]:
+        """Get clients that stop being re-warmed when they ask their question."""
+        return [
+            {**client, "ask_question": partial(self._release_and_ask, client)}
+            for client in self.clients
+        ]
+
+    def start(self) -> None:
+        """Start re-warming every client's connection."""
+        self.stop()
+        with self._lock:
+            self._released = set()
+            self._savings = {}
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, args=(self._stop_event,), daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> Dict[str, float]:
+        """Stop re-warming, wait for the warm-up thread and return the savings."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        with self._lock:
+            return dict(self._savings)
+
+    def release(self, model_name: str) -> None:
+        """Stop re-warming a client and record the setup time it saves."""
+        # Waits for a running warm-up, which holds the pooled connection
+        with self._client_locks[model_name], self._lock:
+            if model_name in self._released:
+                return
+            self._released.add(model_name)
+            saving = self._get_setup_saving(model_name)
+            if saving is not None:
+                self._savings[model_name] = saving
+
+    def _release_and_ask(self, client: Dict[str, Any], *args: Any) -> Any:
+        """Release a client from re-warming, then ask its question."""
+        self.release(client["model_name"])
+        return client["ask_question"](*args)
+
+    def _run(self, stop_event: threading.Event) -> None:
+        """Warm up clients at an interval shorter than the keepalive expiry."""
+        deadline = time.time() + self.max_duration
+        with ThreadPoolExecutor(max_workers=len(self.clients)) as executor:
+            while not stop_event.is_set() and time.time() < deadline:
+                with self._lock:
+                    if len(self._released) == len(self.clients):
+                        return
+                warm_up = partial(self._warm_up_client, stop_event=stop_event)
+                list(executor.map(warm_up, self.clients))
+                stop_event.wait(self.interval)
+
+    def _warm_up_client(
+        self, client: Dict[str, Any], stop_event: threading.Event
+    ) -> None:
+        """Warm up a single client's connection and record how long it took."""
+        model_name = client["model_name"]
+        with self._client_locks[model_name]:
+            with self._lock:
+                if model_name in self._released or stop_event.is_set():
+                    return
+
+            start_time = time.time()
+            try:
+                client["warm_up"]()
+            except Exception:
+                return
+            finish_time = time.time()
+
+            with self._lock:
+                last_warmed = self._last_warmed.get(model_name)
+                if model_name not in self._cold_latency:
+                    self._cold_latency[model_name] = finish_time - start_time
+                elif last_warmed and start_time - last_warmed < KEEPALIVE_EXPIRY:
+                    self._warm_latency[model_name] = finish_time - start_time
+                self._last_warmed[model_name] = finish_time
+
+    def _get_setup_saving(self, model_name: str) -> Optional[float]:
+        """Get the setup time saved by a client's connection, if it is still warm."""
+        cold_latency = self._cold_latency.get(model_name)
+        warm_latency = self._warm_latency.get(model_name)
+        last_warmed = self._last_warmed.get(model_name)
+        if cold_latency is None or warm_latency is None or last_warmed is None:
+            return None
+        if time.time() - last_warmed >= KEEPALIVE_EXPIRY:
+            return None
+        return max(0.0, cold_latency - warm_latency)
+
+
+def calculate_critical_path_savings(
+    clients: List[Dict[str, Any]], savings: Dict[str, float]
+) -> float:
+    """Get the time saved along the pipeline, where fact-checkers run in parallel."""
+    if not clients:
+        return 0.0
+    model_names = [client["model_name"] for client in clients]
+    total = savings.get(model_names[0], 0.0)
+    if len(model_names) > 1:
+        total += savings.get(model_names[-1], 0.0)
+    fact_checker_savings = [savings.get(name, 0.0) for name in model_names[1:-1]]
+    return total + max(fact_checker_savings, default=0.0)
+
+
+def display_prewarm_report(
+    clients: List[Dict[str, Any]], savings: Dict[str, float]
+) -> None:
+    """Display how much connection setup time was saved by pre-warming."""
+    saved = calculate_critical_path_savings(clients, savings)
+    console.print(
+        f"[{COLORS['muted']}]{len(savings)}/{len(clients)} provider connections "
+        f"were warm when used, saving ~{saved:.2f} seconds of connection setup[/]"
+    )
+
+
+def is_exit_command(question: Optional[str]) -> bool:
+    """Check whether the input should end the interactive session."""
+    return question is None or question.lower() in EXIT_COMMANDS
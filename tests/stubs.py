@@ -0,0 +1,37 @@
+import re
+from typing import Any, Callable, Dict, List, Optional
+
+from models import create_llm_response, create_token_usage
+
+
+def create_stub_client(
+    model_name: str,
+    calls: Optional[List[str]] = None,
+    fail: bool = False,
+    fail_on: Optional[str] = None,
+    warm_up: Optional[Callable[[], None]] = None,
+) -> Dict[str, Any]:
+    """Create client functions that answer without calling a provider.
+
+    Packed prompts are answered with one "### Item N" section per item. Every
+    call costs 110, one per input and output token.
+    """
+
+    def ask_question(prompt: str, prompt_type: Any = None) -> Any:
+        if calls is not None:
+            calls.append(model_name)
+        if fail or (fail_on is not None and fail_on in prompt):
+            raise RuntimeError("provider outage")
+        item_ids = re.findall(r'<item id="(\d+)">', prompt)
+        text = "\n".join(f"### Item {item_id}\nChecked" for item_id in item_ids)
+        return create_llm_response(
+            text=text or f"- **Verdict:** Verified ({model_name})",
+            usage=create_token_usage(100, 10),
+        )
+
+    return {
+        "ask_question": ask_question,
+        "calculate_costs": lambda usage: usage.input_tokens + usage.output_tokens,
+        "model_name": model_name,
+        "warm_up": warm_up or (lambda: None),
+    }
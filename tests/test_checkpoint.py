@@ -0,0 +1,120 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from checkpoint import CheckpointJournal, get_journal_path
+from models import create_validation_result
+from validator import validate_with_models
+
+from tests.stubs import create_stub_client
+
+
+def _result(model_name: str, answer: str):
+    """Create a validation result for the test question."""
+    return create_validation_result(
+        question="Q?", model_name=model_name, answer=answer, cost=1.0
+    )
+
+
+class TestCheckpointJournal(unittest.TestCase):
+    """Test writing and replaying the checkpoint journal."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "questions.journal.jsonl")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_replay_restores_stages_and_completed_questions(self):
+        """Test that a resumed journal restores what was recorded."""
+        journal = CheckpointJournal(self.path)
+        journal.record_stage("Q?", 0, _result("gpt-4o-mini", "Answer"))
+        journal.mark_complete("Q?")
+        journal.close()
+
+        resumed = CheckpointJournal(self.path, resume=True)
+        self.assertEqual(resumed.get_stage("Q?", 0).answer, "Answer")
+        self.assertTrue(resumed.is_complete("Q?"))
+        resumed.close()
+
+    def test_replay_ignores_truncated_last_line(self):
+        """Test that a partially written last entry is skipped and overwritten."""
+        journal = CheckpointJournal(self.path)
+        journal.record_stage("Q?", 0, _result("gpt-4o-mini", "Answer"))
+        journal.close()
+        with open(self.path, "a") as f:
+            f.write('{"type": "complete", "quest')
+
+        resumed = CheckpointJournal(self.path, resume=True)
+        self.assertIsNotNone(resumed.get_stage("Q?", 0))
+        self.assertFalse(resumed.is_complete("Q?"))
+        resumed.record_stage("Q?", 1, _result("gemini-2.0-flash", "Check"))
+        resumed.close()
+
+        replayed = CheckpointJournal(self.path, resume=True)
+        self.assertIsNotNone(replayed.get_stage("Q?", 0))
+        self.assertIsNotNone(replayed.get_stage("Q?", 1))
+        self.assertFalse(replayed.is_complete("Q?"))
+        replayed.close()
+
+    def test_without_resume_starts_fresh(self):
+        """Test that opening without resume discards the old journal."""
+        journal = CheckpointJournal(self.path)
+        journal.mark_complete("Q?")
+        journal.close()
+
+        fresh = CheckpointJournal(self.path)
+        self.assertFalse(fresh.is_complete("Q?"))
+        fresh.close()
+
+    def test_journal_path_depends_on_mode_and_directory(self):
+        """Test that modes and same-named files get separate journals."""
+        fast = get_journal_path("a/questions.txt", "fast")
+        self.assertNotEqual(fast, get_journal_path("a/questions.txt", "max"))
+        self.assertNotEqual(fast, get_journal_path("b/questions.txt", "fast"))
+
+
+@patch("validator.save_results_to_file", return_value="results.md")
+class TestResumeAfterFailure(unittest.TestCase):
+    """Test that failed stages are retried on resume."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "questions.journal.jsonl")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _clients(self, calls: list, summarizer_fails: bool):
+        """Create an initial answerer, two fact-checkers and a summarizer."""
+        return [
+            create_stub_client("gpt-4o-mini", calls),
+            create_stub_client("gemini-2.0-flash", calls),
+            create_stub_client("mistral-small-latest", calls),
+            create_stub_client(
+                "claude-3-5-sonnet-latest", calls, fail=summarizer_fails
+            ),
+        ]
+
+    def test_failed_stage_is_not_marked_complete(self, _save):
+        """Test that a question with a failed stage is retried on resume."""
+        journal = CheckpointJournal(self.path)
+        validate_with_models(self._clients([], True), "Q?", journal=journal)
+        journal.close()
+
+        calls = []
+        resumed = CheckpointJournal(self.path, resume=True)
+        self.assertFalse(resumed.is_complete("Q?"))
+        results = validate_with_models(
+            self._clients(calls, False), "Q?", journal=resumed
+        )
+        self.assertEqual(calls, ["claude-3-5-sonnet-latest"])
+        self.assertEqual(len(results), 4)
+        self.assertTrue(resumed.is_complete("Q?"))
+        resumed.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+import unittest
+from unittest.mock import patch
+
+from models import create_packing_config, create_token_usage, split_token_usage
+from validation_helpers import (
+    estimate_tokens,
+    pack_fact_checks,
+    split_packed_fact_checks,
+)
+from validator import validate_batch_with_models
+
+from tests.stubs import create_stub_client
+
+
+class TestSplitPackedFactChecks(unittest.TestCase):
+    """Test splitting a packed fact-check response into items."""
+
+    def test_split_in_order(self):
+        """Test that every item section is returned."""
+        text = "Intro\n### Item 1\nFirst\n### Item 2\nSecond"
+        self.assertEqual(split_packed_fact_checks(text, 2), ["First", "Second"])
+
+    def test_missing_and_empty_items(self):
+        """Test that missing or empty items are returned as None."""
+        text = "### Item 1\n\n## Item 3\nThird"
+        self.assertEqual(split_packed_fact_checks(text, 3), [None, None, "Third"])
+
+    def test_duplicate_and_unknown_items(self):
+        """Test that duplicated items are dropped and unknown ids ignored."""
+        text = "### Item 1\nA\n### Item 2\nB\n### Item 2\nC\n### Item 9\nD"
+        self.assertEqual(split_packed_fact_checks(text, 2), ["A", None])
+
+
+class TestSplitTokenUsage(unittest.TestCase):
+    """Test splitting a packed request's token usage between items."""
+
+    def test_proportional_split_keeps_remainder(self):
+        """Test that shares follow the weights and add up to the total."""
+        usages = split_token_usage(create_token_usage(1000, 101), [3, 1], [1, 2])
+        self.assertEqual([usage.input_tokens for usage in usages], [750, 250])
+        self.assertEqual(sum(usage.output_tokens for usage in usages), 101)
+
+    def test_zero_weights_split_evenly(self):
+        """Test that all-zero weights split the tokens evenly."""
+        usages = split_token_usage(create_token_usage(10, 9), [1, 1, 1], [0, 0, 0])
+        self.assertEqual([usage.output_tokens for usage in usages], [3, 3, 3])
+        self.assertEqual(sum(usage.input_tokens for usage in usages), 10)
+
+
+class TestPackFactChecks(unittest.TestCase):
+    """Test grouping answers into packs."""
+
+    def test_max_questions(self):
+        """Test that packs hold at most the configured number of questions."""
+        packs = pack_fact_checks([("Q?", "A")] * 7, 100000, 3)
+        self.assertEqual([len(pack) for pack in packs], [3, 3, 1])
+
+    def test_token_budget(self):
+        """Test that a long answer starts a new pack and goes alone."""
+        long_answer = "x" * 40000
+        items = [("Q?", "A"), ("Q?", long_answer), ("Q?", "A")]
+        packs = pack_fact_checks(items, 6000, 5)
+        self.assertEqual([len(pack) for pack in packs], [1, 1, 1])
+        self.assertGreater(estimate_tokens(long_answer), 6000)
+
+
+@patch("validator.save_results_to_file", return_value="results.md")
+class TestValidateBatchWithModels(unittest.TestCase):
+    """Test packed validation of a group of questions."""
+
+    def test_failed_initial_answer_does_not_stop_batch(self, save):
+        """Test that other questions finish when one initial answer fails."""
+        clients = [
+            create_stub_client("gpt-4o-mini", fail_on="B?"),
+            create_stub_client("gemini-2.0-flash"),
+            create_stub_client("mistral-small-latest"),
+            create_stub_client("claude-3-5-sonnet-latest"),
+        ]
+        runs = validate_batch_with_models(
+            clients, ["A?", "B?", "C?"], create_packing_config()
+        )
+        self.assertEqual([len(results) for results in runs], [4, 0, 4])
+        self.assertEqual(save.call_count, 2)
+
+    def test_packed_cost_is_split_between_questions(self, _save):
+        """Test that one packed request's cost is shared by its questions."""
+        clients = [
+            create_stub_client("gpt-4o-mini"),
+            create_stub_client("gemini-2.0-flash"),
+            create_stub_client("claude-3-5-sonnet-latest"),
+        ]
+        runs = validate_batch_with_models(
+            clients, ["A?", "B?"], create_packing_config()
+        )
+        fact_check_costs = [results[1].cost for results in runs]
+        self.assertEqual(sum(fact_check_costs), 110)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+import unittest
+
+from models import create_quorum_config, create_validation_result
+from validation_helpers import (
+    count_agreeing_verdicts,
+    extract_overall_verdict,
+    extract_verdicts,
+)
+from validator import _quorum_reached
+
+
+def _fact_check(answer: str):
+    """Create a fact-check result with the given answer."""
+    return create_validation_result(
+        question="Q?", model_name="gemini-2.0-flash", answer=answer
+    )
+
+
+class TestVerdicts(unittest.TestCase):
+    """Test extracting verdicts from fact-check responses."""
+
+    def test_extract_verdicts_from_verdict_lines_only(self):
+        """Test that only labels on verdict lines are extracted."""
+        fact_check = (
+            "- **Claim:** The answer is False modesty.\n"
+            "- **Verdict:** Verified\n"
+            "- **Verdict:** Unverified\n"
+        )
+        self.assertEqual(extract_verdicts(fact_check), {"verified", "unverified"})
+
+    def test_overall_verdict_uses_most_severe_label(self):
+        """Test that the most severe claim verdict decides the overall verdict."""
+        fact_check = "- **Verdict:** Verified\n- **Verdict:** Misleading\n"
+        self.assertEqual(extract_overall_verdict(fact_check), "disputed")
+
+    def test_overall_verdict_without_verdicts(self):
+        """Test that a fact-check without verdicts has no overall verdict."""
+        self.assertIsNone(extract_overall_verdict("Looks fine to me."))
+
+    def test_count_agreeing_verdicts(self):
+        """Test counting the largest group with the same overall verdict."""
+        fact_checks = [
+            "- **Verdict:** Verified",
+            "- **Verdict:** Verified\n- **Verdict:** Verified",
+            "- **Verdict:** False",
+            "No verdict here",
+        ]
+        self.assertEqual(count_agreeing_verdicts(fact_checks), 2)
+
+
+class TestQuorumReached(unittest.TestCase):
+    """Test deciding when enough fact-checkers have returned."""
+
+    def test_without_quorum_waits_for_all(self):
+        """Test that no quorum is never reached early."""
+        fact_checks = [_fact_check("- **Verdict:** Verified")] * 3
+        self.assertFalse(_quorum_reached(fact_checks, None))
+
+    def test_quorum_size(self):
+        """Test that the quorum is reached once enough fact-checks returned."""
+        quorum = create_quorum_config(size=2)
+        fact_check = _fact_check("- **Verdict:** Verified")
+        self.assertFalse(_quorum_reached([fact_check], quorum))
+        self.assertTrue(_quorum_reached([fact_check, fact_check], quorum))
+
+    def test_quorum_requires_agreement(self):
+        """Test that disagreeing fact-checks do not reach an agreeing quorum."""
+        quorum = create_quorum_config(size=2, require_agreement=True)
+        verified = _fact_check("- **Verdict:** Verified")
+        disputed = _fact_check("- **Verdict:** False")
+        self.assertFalse(_quorum_reached([verified, disputed], quorum))
+        self.assertTrue(_quorum_reached([verified, disputed, verified], quorum))
+
+
+if __name__ == "__main__":
+    unittest.main()
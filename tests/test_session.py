@@ -0,0 +1,113 @@
+import time
+import unittest
+from typing import Callable
+from unittest.mock import patch
+
+from session import ConnectionWarmer, calculate_critical_path_savings
+
+from tests.stubs import create_stub_client
+
+
+def _warm_up(cold: float, warm: float, events: list) -> Callable[[], None]:
+    """Create a warm-up that is slow the first time and fast afterwards."""
+
+    def warm_up():
+        events.append("start")
+        time.sleep(warm if "end" in events else cold)
+        events.append("end")
+
+    return warm_up
+
+
+class TestConnectionWarmer(unittest.TestCase):
+    """Test keeping connections warm until each client is used."""
+
+    def test_saving_is_cold_minus_warm_latency(self):
+        """Test that a warm client saves its connection setup time."""
+        client = create_stub_client("gpt-4o-mini", warm_up=_warm_up(0.2, 0.0, []))
+        warmer = ConnectionWarmer([client], interval=0.05)
+
+        warmer.start()
+        time.sleep(0.4)
+        warmer.release("gpt-4o-mini")
+        savings = warmer.stop()
+
+        self.assertAlmostEqual(savings["gpt-4o-mini"], 0.2, delta=0.05)
+
+    def test_expired_connection_saves_nothing(self):
+        """Test that a connection idle past the keepalive expiry is not counted."""
+        client = create_stub_client("gpt-4o-mini", warm_up=_warm_up(0.1, 0.0, []))
+        warmer = ConnectionWarmer([client], interval=0.05, max_duration=0.2)
+
+        with patch("session.KEEPALIVE_EXPIRY", 0.1):
+            warmer.start()
+            time.sleep(0.5)
+            warmer.release("gpt-4o-mini")
+        self.assertEqual(warmer.stop(), {})
+
+    def test_release_waits_for_running_warm_up(self):
+        """Test that a client is not used while its warm-up holds the connection."""
+        events = []
+        warm_up = _warm_up(0.2, 0.0, events)
+        client = create_stub_client("gpt-4o-mini", warm_up=warm_up)
+        warmer = ConnectionWarmer([client], interval=0.05)
+
+        warmer.start()
+        time.sleep(0.05)
+        warmer.release("gpt-4o-mini")
+        self.assertEqual(events, ["start", "end"])
+        warmer.stop()
+
+    def test_wrapped_client_stops_warming_when_asked(self):
+        """Test that asking a question releases only that client."""
+        first_events, second_events = [], []
+        clients = [
+            create_stub_client("gpt-4o-mini", warm_up=_warm_up(0, 0, first_events)),
+            create_stub_client("claude-x", warm_up=_warm_up(0, 0, second_events)),
+        ]
+        warmer = ConnectionWarmer(clients, interval=0.05)
+
+        warmer.start()
+        time.sleep(0.1)
+        warmer.wrap_clients()[0]["ask_question"]("Q?", None)
+        first_count = len(first_events)
+        second_count = len(second_events)
+        time.sleep(0.2)
+        warmer.stop()
+
+        self.assertEqual(len(first_events), first_count)
+        self.assertGreater(len(second_events), second_count)
+
+    def test_stop_waits_for_warm_up_thread(self):
+        """Test that stopping joins the warm-up thread."""
+        events = []
+        warm_up = _warm_up(0.2, 0.2, events)
+        client = create_stub_client("gpt-4o-mini", warm_up=warm_up)
+        warmer = ConnectionWarmer([client], interval=0.05)
+
+        warmer.start()
+        time.sleep(0.05)
+        thread = warmer._thread
+        warmer.stop()
+        self.assertEqual(events[-1], "end")
+        self.assertFalse(thread.is_alive())
+
+
+class TestCriticalPathSavings(unittest.TestCase):
+    """Test adding up savings along the validation pipeline."""
+
+    def test_fact_checkers_count_once(self):
+        """Test that parallel fact-checkers only add their largest saving."""
+        names = ("first", "check-a", "check-b", "last")
+        clients = [create_stub_client(name) for name in names]
+        savings = {"first": 0.1, "check-a": 0.3, "check-b": 0.2, "last": 0.05}
+        self.assertAlmostEqual(calculate_critical_path_savings(clients, savings), 0.45)
+
+    def test_missing_savings_count_as_zero(self):
+        """Test that clients that were not warm save nothing."""
+        clients = [create_stub_client("first"), create_stub_client("last")]
+        self.assertEqual(calculate_critical_path_savings(clients, {"last": 0.2}), 0.2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -7,9 +7,12 @@ from rich.text import Text
 from pathlib import Path
 from datetime import datetime
 import os
-from typing import Dict, List, Optional, Any, Callable
+import threading
+from typing import List, Any
 from functools import partial
 
+from models import ValidationResult
+
 console = Console()
 
 COLORS = {
@@ -82,29 +85,50 @@ def get_question() -> str:
     return console.input("[bold cyan]Enter your question: [/]").strip()
 
 
+def read_questions_file(filename: str) -> List[str]:
+    """Read one question per non-empty line from a file."""
+    with open(filename, "r") as file:
+        return [line.strip() for line in file if line.strip()]
+
+
 def ensure_output_directory() -> None:
     """Ensure the output directory exists."""
     os.makedirs("outputs", exist_ok=True)
 
 
-def save_results_to_file(results: List[Dict[str, Any]]) -> None:
-    """Save the validation results to a file."""
+def _write_result(file: Any, result: ValidationResult) -> None:
+    """Write a single validation result section."""
+    file.write(f"## Model: {result.model_name}\n")
+    file.write(f"Timestamp: {result.timestamp}\n")
+    file.write(f"### Answer:\n{result.answer}\n\n")
+    file.write(f"---\n")
+
+
+def save_results_to_file(results: List[ValidationResult]) -> str:
+    """Save the validation results to a file and return its path."""
     ensure_output_directory()
-    filename = f"outputs/validation_{datetime.now().strftime('%Y%m%d_%H%M%S')}.md"
+    filename = f"outputs/validation_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}.md"
 
     with open(filename, "w") as file:
         file.write(f"# Question: \n")
-        file.write(f"{results[0]['question']}\n\n")
+        file.write(f"{results[0].question}\n\n")
         for result in results:
-            file.write(f"## Model: {result['model_name']}\n")
-            file.write(f"Timestamp: {result['timestamp']}\n")
-            file.write(f"### Answer:\n{result['answer']}\n\n")
-            file.write(f"---\n")
+            _write_result(file, result)
 
     console.print(f"[{COLORS['info']}]Results saved to:[/] {os.path.abspath(filename)}")
+    return filename
+
+
+_append_lock = threading.Lock()
+
+
+def append_result_to_file(filename: str, result: ValidationResult) -> None:
+    """Append a late validation result to a saved results file."""
+    with _append_lock, open(filename, "a") as file:
+        _write_result(file, result)
 
 
-def create_summary_table(results: List[Dict[str, Any]], total_time: float, total_cost: float) -> Table:
+def create_summary_table(results: List[ValidationResult], total_time: float, total_cost: float) -> Table:
     """Create a summary table with model information."""
     table = Table(title="Cross-Validation Summary")
     
@@ -114,9 +138,9 @@ def create_summary_table(results: List[Dict[str, Any]], total_time: float, total
     table.add_column("Cost (SEK)", justify="right")
     
     for result in results:
-        model_name = result["model_name"]
+        model_name = result.model_name
         provider = get_provider_from_model_name(model_name)
-        cost = result["cost"] / 1000000  # Convert to dollars
+        cost = result.cost / 1000000  # Convert to dollars
         sek_cost = convert_to_sek(cost)
         color = get_provider_color(model_name)
         
@@ -139,7 +163,7 @@ def create_summary_table(results: List[Dict[str, Any]], total_time: float, total
     return table
 
 
-def print_summary_table(results: List[Dict[str, Any]], total_time: float, total_cost: float) -> None:
+def print_summary_table(results: List[ValidationResult], total_time: float, total_cost: float) -> None:
     """Print a summary table with model information."""
     table = create_summary_table(results, total_time, total_cost)
     
@@ -1,30 +1,142 @@
-from typing import Any, Dict, List, Callable
+import re
+from collections import Counter
+from typing import FrozenSet, List, Callable, Optional, Tuple
 from clients.client_types import PromptType
 from config import get_prompt_template
+from models import LLMResponse, ValidationResult
+
+
+VERDICT_LABELS = (
+    "Verified",
+    "Unverified",
+    "False",
+    "Misleading",
+    "Needs More Information",
+)
+
+# Overall verdicts, from most to least severe, and the labels that lead to them
+OVERALL_VERDICTS = (
+    ("disputed", {"false", "misleading"}),
+    ("uncertain", {"unverified", "needs more information"}),
+    ("supported", {"verified"}),
+)
+
+VERDICT_PATTERN = re.compile(
+    r"\b(" + "|".join(VERDICT_LABELS) + r")\b", re.IGNORECASE
+)
+
+PACKED_ITEM_HEADER = re.compile(r"^#+\s*Item\s+(\d+)\s*$", re.MULTILINE)
+
+CHARS_PER_TOKEN = 4
 
 
 def validate_answer(
     ask_question_fn: Callable,
     original_question: str,
     initial_answer: str,
-) -> Dict[str, Any]:
+) -> LLMResponse:
     """Validate an answer using the LLM."""
     prompt = get_prompt_template("validation").format(
-        original_question=original_question, initial_answer=initial_answer
+        original_question=original_question,
+        initial_answer=initial_answer,
+        fact_check_process=get_prompt_template("fact_check_process"),
+    )
+    return ask_question_fn(prompt, PromptType.VALIDATION)
+
+
+def estimate_tokens(text: str) -> int:
+    """Roughly estimate the number of tokens in a text."""
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+def format_packed_item(item_id: int, question: str, initial_answer: str) -> str:
+    """Format a question and answer as a delimited section of a packed prompt."""
+    return (
+        f'<item id="{item_id}">\n'
+        f"<question>{question}</question>\n"
+        f"<answer>{initial_answer}</answer>\n"
+        f"</item>"
+    )
+
+
+def pack_fact_checks(
+    items: List[Tuple[str, str]], token_budget: int, max_questions: int
+) -> List[List[Tuple[str, str]]]:
+    """Group (question, answer) pairs into packs that fit the token budget."""
+    overhead = estimate_tokens(
+        get_prompt_template("packed_validation")
+        + get_prompt_template("fact_check_process")
+    )
+    packs = []
+    current_pack = []
+    current_tokens = overhead
+
+    for question, initial_answer in items:
+        item_tokens = estimate_tokens(
+            format_packed_item(len(current_pack) + 1, question, initial_answer)
+        )
+        if current_pack and (
+            current_tokens + item_tokens > token_budget
+            or len(current_pack) >= max_questions
+        ):
+            packs.append(current_pack)
+            current_pack = []
+            current_tokens = overhead
+        current_pack.append((question, initial_answer))
+        current_tokens += item_tokens
+
+    if current_pack:
+        packs.append(current_pack)
+    return packs
+
+
+def validate_answers_packed(
+    ask_question_fn: Callable,
+    items: List[Tuple[str, str]],
+) -> LLMResponse:
+    """Validate several answers with a single LLM request."""
+    sections = "\n\n".join(
+        format_packed_item(item_id, question, initial_answer)
+        for item_id, (question, initial_answer) in enumerate(items, start=1)
+    )
+    prompt = get_prompt_template("packed_validation").format(
+        items=sections,
+        fact_check_process=get_prompt_template("fact_check_process"),
     )
     return ask_question_fn(prompt, PromptType.VALIDATION)
 
 
+def split_packed_fact_checks(text: str, item_count: int) -> List[Optional[str]]:
+    """Split a packed fact-check response into one section per item.
+
+    Items whose section is missing, duplicated or empty are returned as None.
+    """
+    headers = list(PACKED_ITEM_HEADER.finditer(text))
+    sections: List[Optional[str]] = [None] * item_count
+    seen = set()
+
+    for header, next_header in zip(headers, headers[1:] + [None]):
+        item_id = int(header.group(1))
+        if not 1 <= item_id <= item_count:
+            continue
+        end = next_header.start() if next_header else len(text)
+        section = text[header.end() : end].strip()
+        sections[item_id - 1] = None if item_id in seen else section or None
+        seen.add(item_id)
+
+    return sections
+
+
 def summarize_answer(
     ask_question_fn: Callable,
-    discussion: List[Dict[str, Any]],
-) -> Dict[str, Any]:
+    discussion: List[ValidationResult],
+) -> LLMResponse:
     """Summarize a discussion using the LLM."""
-    question = discussion[0]["question"]
+    question = discussion[0].question
 
     full_discussion = "\n\n".join(
         [
-            f"Question: {result['question']}\nAnswer: {result['answer']}"
+            f"Question: {result.question}\nAnswer: {result.answer}"
             for result in discussion
         ]
     )
@@ -32,3 +144,34 @@ def summarize_answer(
         original_question=question, discussion=full_discussion
     )
     return ask_question_fn(prompt, PromptType.DEFAULT)
+
+
+def extract_verdicts(fact_check: str) -> FrozenSet[str]:
+    """Extract the set of verdict labels from a fact-check response."""
+    verdicts = set()
+    for line in fact_check.splitlines():
+        if "verdict" not in line.lower():
+            continue
+        _, _, verdict_text = line.lower().partition("verdict")
+        verdicts.update(
+            match.lower() for match in VERDICT_PATTERN.findall(verdict_text)
+        )
+    return frozenset(verdicts)
+
+
+def extract_overall_verdict(fact_check: str) -> Optional[str]:
+    """Get the overall verdict of a fact-check from its most severe claim verdict."""
+    verdicts = extract_verdicts(fact_check)
+    for overall_verdict, labels in OVERALL_VERDICTS:
+        if verdicts & labels:
+            return overall_verdict
+    return None
+
+
+def count_agreeing_verdicts(fact_checks: List[str]) -> int:
+    """Count the largest group of fact-checks with the same overall verdict."""
+    overall_verdicts = Counter(
+        extract_overall_verdict(fact_check) for fact_check in fact_checks
+    )
+    overall_verdicts.pop(None, None)
+    return max(overall_verdicts.values(), default=0)
@@ -1,13 +1,34 @@
-from typing import List, Dict, Any, Tuple
-from models import create_validation_result
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from functools import partial
+from typing import List, Dict, Any, Callable, Optional, Set, Tuple
+from checkpoint import CheckpointJournal
+from models import (
+    LLMResponse,
+    PackingConfig,
+    QuorumConfig,
+    ValidationResult,
+    add_token_usage,
+    create_llm_response,
+    create_validation_result,
+    split_token_usage,
+)
 from utils import (
     save_results_to_file,
+    append_result_to_file,
     console,
     COLORS,
     display_header,
     get_provider_color,
 )
-from validation_helpers import validate_answer, summarize_answer
+from validation_helpers import (
+    count_agreeing_verdicts,
+    format_packed_item,
+    pack_fact_checks,
+    split_packed_fact_checks,
+    summarize_answer,
+    validate_answer,
+    validate_answers_packed,
+)
 
 
 def _display_action_status(client: Dict[str, Any], action: str) -> None:
@@ -33,15 +54,15 @@ def _process_client(
     index: int,
     total_count: int,
     initial_answer: str,
-    results: List[Dict[str, Any]],
-) -> Tuple[Dict[str, Any], str]:
+    results: List[ValidationResult],
+) -> Tuple[LLMResponse, str]:
     """Process a single client's response."""
     action = _determine_action(index, total_count)
     _display_action_status(client, action)
 
     if index == 0:
         response = client["ask_question"](question, None)
-        initial_answer_text = response["text"]
+        initial_answer_text = response.text
         return response, initial_answer_text
     elif index == total_count - 1:
         response = summarize_answer(client["ask_question"], results)
@@ -52,15 +73,15 @@ def _process_client(
 
 
 def _calculate_and_create_result(
-    client: Dict[str, Any], question: str, response: Dict[str, Any]
-) -> Dict[str, Any]:
+    client: Dict[str, Any], question: str, response: LLMResponse
+) -> ValidationResult:
     """Calculate costs and create validation result."""
-    cost = client["calculate_costs"](response["raw_response"])
+    cost = client["calculate_costs"](response.usage)
 
     result = create_validation_result(
         question=question,
         model_name=client["model_name"],
-        answer=response["text"],
+        answer=response.text,
         cost=cost,
     )
 
@@ -78,23 +99,481 @@ def _handle_client_error(client: Dict[str, Any], error: Exception) -> None:
     console.print(f"[{COLORS['muted']}]Continuing to next model...[/]")
 
 
+def _restore_stage(
+    journal: Optional[CheckpointJournal],
+    client: Dict[str, Any],
+    question: str,
+    index: int,
+) -> Optional[ValidationResult]:
+    """Get a stage's result from the checkpoint journal, if it was completed."""
+    if journal is None:
+        return None
+    result = journal.get_stage(question, index)
+    if result is None or result.model_name != client["model_name"]:
+        return None
+    console.print(
+        f"[{COLORS['muted']}]✓ {client['model_name']} restored from checkpoint[/]"
+    )
+    return result
+
+
+def _record_stage(
+    journal: Optional[CheckpointJournal],
+    question: str,
+    index: int,
+    result: ValidationResult,
+) -> None:
+    """Record a completed stage in the checkpoint journal."""
+    if journal is not None:
+        journal.record_stage(question, index, result)
+
+
+def _run_client(
+    client: Dict[str, Any],
+    question: str,
+    index: int,
+    total_count: int,
+    initial_answer: Optional[str],
+    results: List[ValidationResult],
+    journal: Optional[CheckpointJournal] = None,
+) -> Optional[str]:
+    """Run a single client, record its result and return the initial answer."""
+    restored = _restore_stage(journal, client, question, index)
+    if restored is not None:
+        results.append(restored)
+        return restored.answer if index == 0 else initial_answer
+
+    try:
+        response, initial_answer = _process_client(
+            client, question, index, total_count, initial_answer, results
+        )
+        result = _calculate_and_create_result(client, question, response)
+        _record_stage(journal, question, index, result)
+        results.append(result)
+    except Exception as e:
+        _handle_client_error(client, e)
+    return initial_answer
+
+
+def _fact_check(
+    client: Dict[str, Any],
+    question: str,
+    index: int,
+    total_count: int,
+    initial_answer: Optional[str],
+    journal: Optional[CheckpointJournal] = None,
+) -> ValidationResult:
+    """Fact-check the initial answer with a single client."""
+    response, _ = _process_client(
+        client, question, index, total_count, initial_answer, []
+    )
+    result = _calculate_and_create_result(client, question, response)
+    _record_stage(journal, question, index, result)
+    return result
+
+
+def _quorum_reached(
+    fact_checks: List[ValidationResult], quorum: Optional[QuorumConfig]
+) -> bool:
+    """Check whether enough fact-checkers have returned, and agree, to move on."""
+    if quorum is None:
+        return False
+    if quorum["require_agreement"]:
+        answers = [result.answer for result in fact_checks]
+        return count_agreeing_verdicts(answers) >= quorum["size"]
+    return len(fact_checks) >= quorum["size"]
+
+
+def _collect_fact_checks(
+    futures: Dict[Future, Dict[str, Any]],
+    quorum: Optional[QuorumConfig],
+    fact_checks: List[ValidationResult],
+) -> Set[Future]:
+    """Collect fact-checks until the quorum is reached and return the stragglers."""
+    pending = set(futures)
+
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            try:
+                fact_checks.append(future.result())
+            except Exception as e:
+                _handle_client_error(futures[future], e)
+        if _quorum_reached(fact_checks, quorum):
+            break
+
+    if pending:
+        console.print(
+            f"[{COLORS['muted']}]Quorum reached with {len(fact_checks)} "
+            f"fact-checks, continuing without {len(pending)} stragglers...[/]"
+        )
+
+    return pending
+
+
+def _run_fact_checkers(
+    clients: List[Dict[str, Any]],
+    question: str,
+    total_count: int,
+    initial_answer: Optional[str],
+    quorum: Optional[QuorumConfig],
+    results: List[ValidationResult],
+    journal: Optional[CheckpointJournal] = None,
+) -> Set[Future]:
+    """Run all fact-checkers concurrently and return the ones still running."""
+    fact_checks = []
+    remaining = {}
+    for index, client in enumerate(clients, start=1):
+        restored = _restore_stage(journal, client, question, index)
+        if restored is not None:
+            fact_checks.append(restored)
+        else:
+            remaining[index] = client
+
+    stragglers = set()
+    if remaining and not _quorum_reached(fact_checks, quorum):
+        executor = ThreadPoolExecutor(max_workers=len(remaining))
+        futures = {
+            executor.submit(
+                _fact_check,
+                client,
+                question,
+                index,
+                total_count,
+                initial_answer,
+                journal,
+            ): client
+            for index, client in remaining.items()
+        }
+        stragglers = _collect_fact_checks(futures, quorum, fact_checks)
+        executor.shutdown(wait=False)
+
+    results.extend(fact_checks)
+    return stragglers
+
+
+def _append_late_result(filename: str, future: Future) -> None:
+    """Append a straggling fact-check to the saved results once it arrives."""
+    if future.cancelled() or future.exception() is not None:
+        return
+    append_result_to_file(filename, future.result())
+
+
+def _handle_stragglers(
+    stragglers: Set[Future],
+    quorum: Optional[QuorumConfig],
+    append_late: Callable[[Future], None],
+    journal: Optional[CheckpointJournal] = None,
+) -> None:
+    """Cancel stragglers that have not started, or append their late results.
+
+    Stragglers that are already running are still paid for. They are tracked
+    by the journal so it records them before closing, but their cost arrives
+    too late for the summary total.
+    """
+    running = [future for future in stragglers if not future.cancel()]
+    if not running:
+        return
+
+    console.print(
+        f"[{COLORS['muted']}]{len(running)} fact-checks are still running; "
+        f"their cost is not included in the summary total[/]"
+    )
+    append_late_results = quorum is not None and quorum["append_late_results"]
+    for future in running:
+        if journal is not None:
+            journal.track(future)
+        if append_late_results:
+            future.add_done_callback(append_late)
+
+
+def _all_stages_completed(
+    journal: CheckpointJournal,
+    clients: List[Dict[str, Any]],
+    question: str,
+    quorum: Optional[QuorumConfig],
+) -> bool:
+    """Check whether the journal has every stage a question needs."""
+    stages = [journal.get_stage(question, index) for index in range(len(clients))]
+    if stages[0] is None or stages[-1] is None:
+        return False
+    fact_checks = [stage for stage in stages[1:-1] if stage is not None]
+    return len(fact_checks) == len(clients) - 2 or _quorum_reached(
+        fact_checks, quorum
+    )
+
+
+def _save_and_checkpoint(
+    clients: List[Dict[str, Any]],
+    question: str,
+    results: List[ValidationResult],
+    quorum: Optional[QuorumConfig],
+    journal: Optional[CheckpointJournal] = None,
+) -> Optional[str]:
+    """Save a question's results and mark it complete if no stage is missing."""
+    if not results:
+        console.print(
+            f"[{COLORS['error']}]No model answered:[/] {question} (nothing saved)"
+        )
+        return None
+
+    filename = save_results_to_file(results)
+    if journal is None:
+        return filename
+
+    if _all_stages_completed(journal, clients, question, quorum):
+        journal.mark_complete(question)
+    else:
+        console.print(
+            f"[{COLORS['muted']}]Some stages failed; --resume will retry them[/]"
+        )
+    return filename
+
+
 def validate_with_models(
-    clients: List[Dict[str, Any]], question: str
-) -> List[Dict[str, Any]]:
-    """Coordinate validation across multiple LLMs."""
+    clients: List[Dict[str, Any]],
+    question: str,
+    quorum: Optional[QuorumConfig] = None,
+    journal: Optional[CheckpointJournal] = None,
+) -> List[ValidationResult]:
+    """Coordinate validation across multiple LLMs.
+
+    Fact-checkers run concurrently. With a quorum, summarization starts as soon
+    as enough of them have returned; otherwise it waits for all of them. With a
+    journal, completed stages are checkpointed and restored instead of re-run.
+    """
     display_header(question)
     results = []
-    initial_answer = None
+    total_count = len(clients)
+
+    initial_answer = _run_client(
+        clients[0], question, 0, total_count, None, results, journal
+    )
+
+    stragglers = set()
+    fact_checkers = clients[1:-1]
+    if fact_checkers:
+        stragglers = _run_fact_checkers(
+            fact_checkers,
+            question,
+            total_count,
+            initial_answer,
+            quorum,
+            results,
+            journal,
+        )
+
+    if total_count > 1:
+        _run_client(
+            clients[-1],
+            question,
+            total_count - 1,
+            total_count,
+            initial_answer,
+            results,
+            journal,
+        )
+
+    filename = _save_and_checkpoint(clients, question, results, quorum, journal)
+    if filename is not None:
+        _handle_stragglers(
+            stragglers, quorum, partial(_append_late_result, filename), journal
+        )
+    return results
 
-    for i, client in enumerate(clients):
+
+def _fact_check_pack(
+    client: Dict[str, Any],
+    index: int,
+    pack: List[Tuple[str, str]],
+    journal: Optional[CheckpointJournal] = None,
+) -> List[ValidationResult]:
+    """Fact-check a pack of answers in one request, falling back per item."""
+    if len(pack) == 1:
+        question, initial_answer = pack[0]
+        response = validate_answer(client["ask_question"], question, initial_answer)
+        result = _calculate_and_create_result(client, question, response)
+        _record_stage(journal, question, index, result)
+        return [result]
+
+    response = validate_answers_packed(client["ask_question"], pack)
+    sections = split_packed_fact_checks(response.text, len(pack))
+    usages = split_token_usage(
+        response.usage,
+        [
+            len(format_packed_item(item_id, question, initial_answer))
+            for item_id, (question, initial_answer) in enumerate(pack, start=1)
+        ],
+        [len(section or "") for section in sections],
+    )
+
+    results = []
+    for (question, initial_answer), section, usage in zip(pack, sections, usages):
         try:
-            response, initial_answer = _process_client(
-                client, question, i, len(clients), initial_answer, results
-            )
-            result = _calculate_and_create_result(client, question, response)
-            results.append(result)
+            if section is None:
+                single = validate_answer(
+                    client["ask_question"], question, initial_answer
+                )
+                section, usage = single.text, add_token_usage(usage, single.usage)
+            item_response = create_llm_response(text=section, usage=usage)
+            result = _calculate_and_create_result(client, question, item_response)
         except Exception as e:
             _handle_client_error(client, e)
+            continue
+        _record_stage(journal, question, index, result)
+        results.append(result)
+    return results
 
-    save_results_to_file(results)
+
+def _fact_check_packed(
+    client: Dict[str, Any],
+    index: int,
+    items: List[Tuple[str, str]],
+    packing: PackingConfig,
+    journal: Optional[CheckpointJournal] = None,
+) -> List[ValidationResult]:
+    """Fact-check several answers with one client, packing them into requests."""
+    _display_action_status(client, f"Fact-checking {len(items)} answers")
+    packs = pack_fact_checks(items, packing["token_budget"], packing["max_questions"])
+    results = []
+    for pack in packs:
+        try:
+            results.extend(_fact_check_pack(client, index, pack, journal))
+        except Exception as e:
+            _handle_client_error(client, e)
     return results
+
+
+def _collect_packed_fact_checks(
+    futures: Dict[Future, Dict[str, Any]],
+    quorum: Optional[QuorumConfig],
+    fact_checks: Dict[str, List[ValidationResult]],
+) -> Set[Future]:
+    """Collect packed fact-checks until every question reaches the quorum."""
+    pending = set(futures)
+
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            try:
+                for result in future.result():
+                    fact_checks[result.question].append(result)
+            except Exception as e:
+                _handle_client_error(futures[future], e)
+        if all(_quorum_reached(checks, quorum) for checks in fact_checks.values()):
+            break
+
+    if pending:
+        console.print(
+            f"[{COLORS['muted']}]Quorum reached for every question, continuing "
+            f"without {len(pending)} stragglers...[/]"
+        )
+
+    return pending
+
+
+def _run_packed_fact_checkers(
+    clients: List[Dict[str, Any]],
+    initial_answers: Dict[str, str],
+    quorum: Optional[QuorumConfig],
+    packing: PackingConfig,
+    runs: Dict[str, List[ValidationResult]],
+    journal: Optional[CheckpointJournal] = None,
+) -> Set[Future]:
+    """Run all fact-checkers concurrently over packed batches of answers."""
+    fact_checks = {question: [] for question in initial_answers}
+    remaining = {}
+    for index, client in enumerate(clients, start=1):
+        items = []
+        for question, initial_answer in initial_answers.items():
+            restored = _restore_stage(journal, client, question, index)
+            if restored is not None:
+                fact_checks[question].append(restored)
+            else:
+                items.append((question, initial_answer))
+        if items:
+            remaining[index] = (client, items)
+
+    stragglers = set()
+    quorum_reached = all(
+        _quorum_reached(checks, quorum) for checks in fact_checks.values()
+    )
+    if remaining and not quorum_reached:
+        executor = ThreadPoolExecutor(max_workers=len(remaining))
+        futures = {
+            executor.submit(
+                _fact_check_packed, client, index, items, packing, journal
+            ): client
+            for index, (client, items) in remaining.items()
+        }
+        stragglers = _collect_packed_fact_checks(futures, quorum, fact_checks)
+        executor.shutdown(wait=False)
+
+    for question, checks in fact_checks.items():
+        runs[question].extend(checks)
+    return stragglers
+
+
+def _append_late_packed_results(filenames: Dict[str, str], future: Future) -> None:
+    """Append straggling packed fact-checks to each question's saved results."""
+    if future.cancelled() or future.exception() is not None:
+        return
+    for result in future.result():
+        if filenames.get(result.question) is not None:
+            append_result_to_file(filenames[result.question], result)
+
+
+def validate_batch_with_models(
+    clients: List[Dict[str, Any]],
+    questions: List[str],
+    packing: PackingConfig,
+    quorum: Optional[QuorumConfig] = None,
+    journal: Optional[CheckpointJournal] = None,
+) -> List[List[ValidationResult]]:
+    """Coordinate validation of several questions, packing the fact-checks.
+
+    Each fact-checker receives the initial answers in as few requests as the
+    token budget allows. Items that cannot be parsed from a packed response
+    are fact-checked again on their own. Questions without an initial answer
+    are skipped rather than stopping the rest of the batch.
+    """
+    total_count = len(clients)
+    runs = {question: [] for question in questions}
+    initial_answers = {}
+
+    for question in questions:
+        display_header(question)
+        initial_answer = _run_client(
+            clients[0], question, 0, total_count, None, runs[question], journal
+        )
+        if initial_answer is not None:
+            initial_answers[question] = initial_answer
+
+    stragglers = set()
+    fact_checkers = clients[1:-1]
+    if fact_checkers and initial_answers:
+        stragglers = _run_packed_fact_checkers(
+            fact_checkers, initial_answers, quorum, packing, runs, journal
+        )
+
+    filenames: Dict[str, Optional[str]] = {}
+    for question in questions:
+        if total_count > 1 and question in initial_answers:
+            _run_client(
+                clients[-1],
+                question,
+                total_count - 1,
+                total_count,
+                initial_answers[question],
+                runs[question],
+                journal,
+            )
+        filenames[question] = _save_and_checkpoint(
+            clients, question, runs[question], quorum, journal
+        )
+
+    _handle_stragglers(
+        stragglers, quorum, partial(_append_late_packed_results, filenames), journal
+    )
+    return [runs[question] for question in questions]
+